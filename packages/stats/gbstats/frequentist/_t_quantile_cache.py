@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+from scipy.special import stdtrit  # type: ignore
+
+
+@lru_cache(maxsize=4096)
+def _t_quantile(q_times_1e9: int, dof_rounded: float) -> float:
+    return float(stdtrit(dof_rounded, q_times_1e9 * 1e-9))
+
+
+def t_ppf_cached(q: float, dof: float) -> float:
+    """t-distribution quantile with memoization on (q, dof).
+
+    Within one experiment, every metric shares the same alpha and nearly the
+    same degrees of freedom, so dashboards recompute the same quantile
+    thousands of times. Quantize q to 1e-9 and dof to 6 decimal digits to get
+    stable cache keys; a hit costs a dict lookup instead of a Cephes
+    inverse-cdf evaluation.
+    """
+    return _t_quantile(int(round(q * 1e9)), round(dof, 6))
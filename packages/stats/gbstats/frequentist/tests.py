@@ -1,10 +1,11 @@
+import math
 from abc import abstractmethod
-from dataclasses import asdict
-from typing import Optional, List
+from functools import cached_property
+from typing import Optional, List, Tuple
 
 import numpy as np
-from pydantic.dataclasses import dataclass
-from scipy.stats import t
+from dataclasses import dataclass
+from scipy.special import stdtr
 
 from gbstats.messages import (
     BASELINE_VARIATION_ZERO_MESSAGE,
@@ -12,9 +13,11 @@ from gbstats.messages import (
     ZERO_SCALED_VARIATION_MESSAGE,
     NO_UNITS_IN_VARIATION_MESSAGE,
 )
+from gbstats.frequentist._kernels import ttest_core
+from gbstats.frequentist._t_quantile_cache import t_ppf_cached
 from gbstats.models.statistics import TestStatistic, ScaledImpactStatistic
 from gbstats.models.tests import BaseABTest, BaseConfig, TestResult, Uplift
-from gbstats.utils import variance_of_ratios, isinstance_union
+from gbstats.utils import isinstance_union
 
 
 # Configs
@@ -23,6 +26,13 @@ class FrequentistConfig(BaseConfig):
     alpha: float = 0.05
     test_value: float = 0
 
+    def __post_init__(self):
+        # fold the alpha-derived quantile probabilities once at config time;
+        # every TTest built from this config reuses them, which also gives
+        # t_ppf_cached a single cache key per alpha
+        self._alpha_half_upper = 1.0 - self.alpha / 2.0
+        self._alpha_upper = 1.0 - self.alpha
+
 
 @dataclass
 class SequentialConfig(FrequentistConfig):
@@ -30,6 +40,8 @@ class SequentialConfig(FrequentistConfig):
 
 
 # Results
+# plain dataclass, same rationale as TestResult: skip pydantic validation
+# of engine-computed values
 @dataclass
 class FrequentistTestResult(TestResult):
     p_value: float
@@ -45,9 +57,21 @@ def frequentist_diff(mean_a, mean_b, relative, mean_a_unadjusted=None) -> float:
         return mean_b - mean_a
 
 
+def frequentist_variance_relative(
+    var_a_over_n_a, mean_a, var_b_over_n_b, mean_b
+) -> float:
+    # delta-method variance of the relative effect; specialization of
+    # variance_of_ratios with zero covariance, so the covariance term
+    # (always -0 here) is dropped instead of being computed
+    inv_a = 1.0 / mean_a
+    inv_a2 = inv_a * inv_a
+    b_over_a = mean_b * inv_a
+    return var_b_over_n_b * inv_a2 + var_a_over_n_a * b_over_a * b_over_a * inv_a2
+
+
 def frequentist_variance(var_a, mean_a, n_a, var_b, mean_b, n_b, relative) -> float:
     if relative:
-        return variance_of_ratios(mean_b, var_b / n_b, mean_a, var_a / n_a, 0)
+        return frequentist_variance_relative(var_a / n_a, mean_a, var_b / n_b, mean_b)
     else:
         return var_b / n_b + var_a / n_a
 
@@ -70,6 +94,8 @@ class TTest(BaseABTest):
         """
         super().__init__(stat_a, stat_b)
         self.alpha = config.alpha
+        self._alpha_half_upper = config._alpha_half_upper
+        self._alpha_upper = config._alpha_upper
         self.test_value = config.test_value
         self.relative = config.difference_type == "relative"
         self.scaled = config.difference_type == "scaled"
@@ -77,42 +103,44 @@ class TTest(BaseABTest):
         self.total_users = config.total_users
         self.phase_length_days = config.phase_length_days
 
-    @property
-    def variance(self) -> float:
-        return frequentist_variance(
-            self.stat_a.variance,
+    @cached_property
+    def _core(self) -> Tuple[float, float, float, float]:
+        """Point estimate, variance, critical value, and dof, computed in
+        one kernel call (native code when numba is installed)
+        """
+        return ttest_core(
+            self.stat_a.mean,
             self.stat_a.unadjusted_mean,
+            self.stat_a.variance,
             self.stat_a.n,
-            self.stat_b.variance,
+            self.stat_b.mean,
             self.stat_b.unadjusted_mean,
+            self.stat_b.variance,
             self.stat_b.n,
             self.relative,
+            self.test_value,
         )
 
-    @property
+    @cached_property
+    def variance(self) -> float:
+        return self._core[1]
+
+    @cached_property
     def point_estimate(self) -> float:
-        return frequentist_diff(
-            self.stat_a.mean,
-            self.stat_b.mean,
-            self.relative,
-            self.stat_a.unadjusted_mean,
-        )
+        return self._core[0]
 
-    @property
+    @cached_property
+    def _stderr(self) -> float:
+        return math.sqrt(self.variance)
+
+    @cached_property
     def critical_value(self) -> float:
-        return (self.point_estimate - self.test_value) / np.sqrt(self.variance)
+        return self._core[2]
 
-    @property
+    @cached_property
     def dof(self) -> float:
         # welch-satterthwaite approx
-        return pow(
-            self.stat_b.variance / self.stat_b.n + self.stat_a.variance / self.stat_a.n,
-            2,
-        ) / (
-            pow(self.stat_b.variance, 2) / (pow(self.stat_b.n, 2) * (self.stat_b.n - 1))
-            + pow(self.stat_a.variance, 2)
-            / (pow(self.stat_a.n, 2) * (self.stat_a.n - 1))
-        )
+        return self._core[3]
 
     @property
     @abstractmethod
@@ -124,6 +152,15 @@ class TTest(BaseABTest):
     def confidence_interval(self) -> List[float]:
         pass
 
+    def _compute_all(self) -> Tuple[float, float, float, float, float]:
+        """Evaluate expected, both CI bounds, p-value, and uplift stddev in
+        one pass. The cached intermediates (point estimate, variance, stderr,
+        dof) are computed once here and shared by all five outputs instead of
+        being re-derived per field.
+        """
+        ci = self.confidence_interval
+        return (self.point_estimate, ci[0], ci[1], self.p_value, self._stderr)
+
     def _default_output(
         self, error_message: Optional[str] = None
     ) -> FrequentistTestResult:
@@ -151,21 +188,20 @@ class TTest(BaseABTest):
                 note the values are with respect to percent uplift,
                 not absolute differences
         """
-        if self.stat_a.mean == 0:
-            return self._default_output(BASELINE_VARIATION_ZERO_MESSAGE)
-        if self.stat_a.unadjusted_mean == 0:
+        if self.stat_a.mean == 0 or self.stat_a.unadjusted_mean == 0:
             return self._default_output(BASELINE_VARIATION_ZERO_MESSAGE)
         if self._has_zero_variance():
             return self._default_output(ZERO_NEGATIVE_VARIANCE_MESSAGE)
 
+        expected, ci_low, ci_high, p_value, stddev = self._compute_all()
         result = FrequentistTestResult(
-            expected=self.point_estimate,
-            ci=self.confidence_interval,
-            p_value=self.p_value,
+            expected=expected,
+            ci=[ci_low, ci_high],
+            p_value=p_value,
             uplift=Uplift(
                 dist="normal",
-                mean=self.point_estimate,
-                stddev=np.sqrt(self.variance),
+                mean=expected,
+                stddev=stddev,
             ),
         )
         if self.scaled:
@@ -180,6 +216,9 @@ class TTest(BaseABTest):
                 adjustment = self.total_users / (
                     self.traffic_percentage * self.phase_length_days
                 )
+                if adjustment == 1.0:
+                    # nothing to scale; skip allocating an identical result
+                    return result
                 return FrequentistTestResult(
                     expected=result.expected * adjustment,
                     ci=[result.ci[0] * adjustment, result.ci[1] * adjustment],
@@ -200,33 +239,34 @@ class TTest(BaseABTest):
 class TwoSidedTTest(TTest):
     @property
     def p_value(self) -> float:
-        return 2 * (1 - t.cdf(abs(self.critical_value), self.dof))  # type: ignore
+        # symmetric lower-tail form avoids cancellation in 1 - cdf
+        return 2 * stdtr(self.dof, -abs(self.critical_value))  # type: ignore
 
     @property
     def confidence_interval(self) -> List[float]:
-        width: float = t.ppf(1 - self.alpha / 2, self.dof) * np.sqrt(self.variance)
+        width: float = t_ppf_cached(self._alpha_half_upper, self.dof) * self._stderr
         return [self.point_estimate - width, self.point_estimate + width]
 
 
 class OneSidedTreatmentGreaterTTest(TTest):
     @property
     def p_value(self) -> float:
-        return 1 - t.cdf(self.critical_value, self.dof)  # type: ignore
+        return stdtr(self.dof, -self.critical_value)  # type: ignore
 
     @property
     def confidence_interval(self) -> List[float]:
-        width: float = t.ppf(1 - self.alpha, self.dof) * np.sqrt(self.variance)
+        width: float = t_ppf_cached(self._alpha_upper, self.dof) * self._stderr
         return [self.point_estimate - width, np.inf]
 
 
 class OneSidedTreatmentLesserTTest(TTest):
     @property
     def p_value(self) -> float:
-        return t.cdf(self.critical_value, self.dof)  # type: ignore
+        return stdtr(self.dof, self.critical_value)  # type: ignore
 
     @property
     def confidence_interval(self) -> List[float]:
-        width: float = t.ppf(1 - self.alpha, self.dof) * np.sqrt(self.variance)
+        width: float = t_ppf_cached(self._alpha_upper, self.dof) * self._stderr
         return [-np.inf, self.point_estimate - width]
 
 
@@ -237,42 +277,51 @@ class SequentialTwoSidedTTest(TTest):
         stat_b: TestStatistic,
         config: SequentialConfig = SequentialConfig(),
     ):
-        config_dict = asdict(config)
-        self.sequential_tuning_parameter = config_dict.pop(
-            "sequential_tuning_parameter"
-        )
-        super().__init__(stat_a, stat_b, FrequentistConfig(**config_dict))
+        # SequentialConfig extends FrequentistConfig and the parent only
+        # reads fields off the config, so no need to rebuild one via asdict
+        # (which deep-copies the config and re-runs pydantic validation)
+        self.sequential_tuning_parameter = config.sequential_tuning_parameter
+        super().__init__(stat_a, stat_b, config)
 
     @property
     def confidence_interval(self) -> List[float]:
         # eq 9 in Waudby-Smith et al. 2023 https://arxiv.org/pdf/2103.06476v7.pdf
         N = self.stat_a.n + self.stat_b.n
-        rho = self.rho
         s2 = self.variance * N
+        tr2p1 = N * self.rho_squared + 1
 
-        width: float = np.sqrt(s2) * np.sqrt(
-            (
-                (2 * (N * np.power(rho, 2) + 1))
-                * np.log(np.sqrt(N * np.power(rho, 2) + 1) / self.alpha)
-                / (np.power(N * rho, 2))
-            )
+        width: float = math.sqrt(s2) * math.sqrt(
+            2
+            * tr2p1
+            * math.log(math.sqrt(tr2p1) / self.alpha)
+            / (N * N * self.rho_squared)
         )
         return [self.point_estimate - width, self.point_estimate + width]
 
-    @property
+    @cached_property
     def rho(self) -> float:
         # eq 161 in https://arxiv.org/pdf/2103.06476v7.pdf
-        return np.sqrt(
-            (-2 * np.log(self.alpha) + np.log(-2 * np.log(self.alpha) + 1))
+        neg_2_log_alpha = -2 * math.log(self.alpha)
+        return math.sqrt(
+            (neg_2_log_alpha + math.log(neg_2_log_alpha + 1))
             / self.sequential_tuning_parameter
         )
 
+    @cached_property
+    def rho_squared(self) -> float:
+        return self.rho * self.rho
+
     @property
     def p_value(self) -> float:
         # eq 155 in https://arxiv.org/pdf/2103.06476v7.pdf
         N = self.stat_a.n + self.stat_b.n
         # slight reparameterization for this quantity below
-        st2 = np.power(self.point_estimate - self.test_value, 2) * N / (self.variance)
-        tr2p1 = N * np.power(self.rho, 2) + 1
-        evalue = np.exp(np.power(self.rho, 2) * st2 / (2 * tr2p1)) / np.sqrt(tr2p1)
+        diff = self.point_estimate - self.test_value
+        st2 = diff * diff * N / self.variance
+        tr2p1 = N * self.rho_squared + 1
+        try:
+            evalue = math.exp(self.rho_squared * st2 / (2 * tr2p1)) / math.sqrt(tr2p1)
+        except OverflowError:
+            # e-value exceeds float range, so the p-value underflows to 0
+            return 0
         return min(1 / evalue, 1)
@@ -0,0 +1,185 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from scipy.special import stdtr, stdtrit
+
+from gbstats.frequentist._kernels import ttest_core_batch
+from gbstats.frequentist.tests import FrequentistConfig, FrequentistTestResult
+from gbstats.models.statistics import TestStatistic
+from gbstats.models.tests import Uplift
+from gbstats.utils import HAS_NUMBA
+
+
+def compute_ttest_batch(
+    mean_a: np.ndarray,
+    umean_a: np.ndarray,
+    var_a: np.ndarray,
+    n_a: np.ndarray,
+    mean_b: np.ndarray,
+    umean_b: np.ndarray,
+    var_b: np.ndarray,
+    n_b: np.ndarray,
+    alpha: float = 0.05,
+    relative: bool = True,
+    two_sided: bool = True,
+    test_value: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized Welch t-test across many experiments at once.
+
+    Inputs are parallel float64 arrays (one element per experiment) holding the
+    per-variation summary statistics, so N experiments are computed with a
+    single pass of numpy ufuncs and a single vectorized call into the
+    t-distribution instead of N scalar scipy calls.
+
+    Rows where the baseline mean is zero or either variance is non-positive
+    are masked out and filled with the same uninformative defaults as
+    `TTest._default_output` (expected=0, ci=[0, 0], p_value=1, stddev=0).
+
+    Args:
+        mean_a, umean_a, var_a, n_a: baseline mean, unadjusted mean,
+            variance, and sample size
+        mean_b, umean_b, var_b, n_b: same quantities for the variation
+        alpha: significance level for the confidence intervals
+        relative: if True, effects are relative uplifts; absolute otherwise
+        two_sided: if True, two-sided p-values and intervals; if False,
+            one-sided with the alternative that treatment is greater
+        test_value: the null-hypothesis effect the p-values test against
+
+    Returns:
+        (expected, ci_low, ci_high, p_value, stddev) arrays, one element
+        per experiment
+    """
+    mean_a = np.asarray(mean_a, dtype=np.float64)
+    umean_a = np.asarray(umean_a, dtype=np.float64)
+    var_a = np.asarray(var_a, dtype=np.float64)
+    n_a = np.asarray(n_a, dtype=np.float64)
+    mean_b = np.asarray(mean_b, dtype=np.float64)
+    umean_b = np.asarray(umean_b, dtype=np.float64)
+    var_b = np.asarray(var_b, dtype=np.float64)
+    n_b = np.asarray(n_b, dtype=np.float64)
+
+    valid = (
+        (mean_a != 0)
+        & (umean_a != 0)
+        & (var_a > 0)
+        & (var_b > 0)
+        & (n_a > 1)
+        & (n_b > 1)
+    )
+    if HAS_NUMBA:
+        # per-row scalar kernel parallelized with prange across all cores;
+        # preallocated outputs avoid per-row allocation and the scipy
+        # t-distribution calls below stay at the boundary on full vectors
+        m = mean_a.shape[0]
+        point_estimate = np.empty(m)
+        variance = np.empty(m)
+        critical_value = np.empty(m)
+        dof = np.empty(m)
+        ttest_core_batch(
+            mean_a,
+            umean_a,
+            var_a,
+            n_a,
+            mean_b,
+            umean_b,
+            var_b,
+            n_b,
+            relative,
+            test_value,
+            valid,
+            point_estimate,
+            variance,
+            critical_value,
+            dof,
+        )
+        stddev = np.sqrt(variance)
+    else:
+        # Safe denominators for masked rows so the vectorized math never
+        # divides by zero; masked outputs are overwritten below anyway
+        safe_umean_a = np.where(valid, umean_a, 1.0)
+        safe_n_a = np.where(n_a > 1, n_a, 2.0)
+        safe_n_b = np.where(n_b > 1, n_b, 2.0)
+
+        var_a_n = var_a / safe_n_a
+        var_b_n = var_b / safe_n_b
+
+        if relative:
+            point_estimate = (mean_b - mean_a) / safe_umean_a
+            inv_a = 1.0 / safe_umean_a
+            inv_a2 = inv_a * inv_a
+            variance = var_b_n * inv_a2 + var_a_n * (umean_b * inv_a) ** 2 * inv_a2
+        else:
+            point_estimate = mean_b - mean_a
+            variance = var_b_n + var_a_n
+
+        stddev = np.sqrt(np.where(valid, variance, 1.0))
+        critical_value = (point_estimate - test_value) / stddev
+        # welch-satterthwaite approx
+        dof = (var_b_n + var_a_n) ** 2 / (
+            var_b_n * var_b_n / (safe_n_b - 1) + var_a_n * var_a_n / (safe_n_a - 1)
+        )
+        dof = np.where(valid, dof, 1.0)
+
+    if two_sided:
+        p_value = 2 * stdtr(dof, -np.abs(critical_value))
+        width = stdtrit(dof, 1 - alpha / 2) * stddev
+        ci_low = point_estimate - width
+        ci_high = point_estimate + width
+    else:
+        p_value = stdtr(dof, -critical_value)
+        width = stdtrit(dof, 1 - alpha) * stddev
+        ci_low = point_estimate - width
+        ci_high = np.full_like(point_estimate, np.inf)
+
+    expected = np.where(valid, point_estimate, 0.0)
+    ci_low = np.where(valid, ci_low, 0.0)
+    ci_high = np.where(valid, ci_high, 0.0)
+    p_value = np.where(valid, p_value, 1.0)
+    stddev = np.where(valid, stddev, 0.0)
+    return expected, ci_low, ci_high, p_value, stddev
+
+
+def compute_results_batch(
+    stats_a: Sequence[TestStatistic],
+    stats_b: Sequence[TestStatistic],
+    config: FrequentistConfig = FrequentistConfig(),
+    two_sided: bool = True,
+) -> List[FrequentistTestResult]:
+    """Batched equivalent of `TTest.compute_result` over many experiments.
+
+    Unpacks the statistics into SoA arrays, runs `compute_ttest_batch` once,
+    and re-packs the outputs into one `FrequentistTestResult` per experiment.
+    Scaled-impact configs are not supported here; use the per-row classes,
+    which apply the scale adjustment in `scale_result`.
+    """
+    if config.difference_type == "scaled":
+        raise ValueError(
+            "compute_results_batch does not support difference_type 'scaled'"
+        )
+    expected, ci_low, ci_high, p_value, stddev = compute_ttest_batch(
+        np.array([s.mean for s in stats_a]),
+        np.array([s.unadjusted_mean for s in stats_a]),
+        np.array([s.variance for s in stats_a]),
+        np.array([s.n for s in stats_a]),
+        np.array([s.mean for s in stats_b]),
+        np.array([s.unadjusted_mean for s in stats_b]),
+        np.array([s.variance for s in stats_b]),
+        np.array([s.n for s in stats_b]),
+        alpha=config.alpha,
+        relative=config.difference_type == "relative",
+        two_sided=two_sided,
+        test_value=config.test_value,
+    )
+    return [
+        FrequentistTestResult(
+            expected=expected[i],
+            ci=[ci_low[i], ci_high[i]],
+            p_value=p_value[i],
+            uplift=Uplift(
+                dist="normal",
+                mean=expected[i],
+                stddev=stddev[i],
+            ),
+        )
+        for i in range(len(expected))
+    ]
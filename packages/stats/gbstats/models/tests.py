@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic.dataclasses import dataclass
-
 from gbstats.models.statistics import (
     RegressionAdjustedStatistic,
     TestStatistic,
@@ -12,6 +11,8 @@ from gbstats.models.settings import DifferenceType
 
 
 # Configs
+# plain dataclass: configs are built with already-typed values by the runner,
+# and skipping pydantic validation keeps per-test construction cheap
 @dataclass
 class BaseConfig:
     difference_type: DifferenceType = "relative"
@@ -21,6 +22,8 @@ class BaseConfig:
 
 
 # Results
+# plain dataclasses: results are built from values the engine just computed,
+# so running pydantic validation on every instantiation is pure overhead
 @dataclass
 class Uplift:
     dist: str
@@ -12,6 +12,7 @@ from gbstats.frequentist.tests import (
     SequentialTwoSidedTTest,
     TwoSidedTTest,
 )
+from gbstats.frequentist.tests_batch import compute_results_batch
 from gbstats.models.statistics import (
     ProportionStatistic,
     RegressionAdjustedStatistic,
@@ -66,7 +67,7 @@ class TestTwoSidedTTest(TestCase):
         expected_rounded_dict = asdict(
             FrequentistTestResult(
                 expected=0.7 - 0.41,
-                ci=(0.04538, 0.53462),
+                ci=[0.04538, 0.53462],
                 uplift=Uplift("normal", 0.29, 0.12478),
                 p_value=0.02016,
             )
@@ -100,6 +101,67 @@ class TestTwoSidedTTest(TestCase):
         self.assertEqual(default_output, result_output)
 
 
+class TestComputeResultsBatch(TestCase):
+    def setUp(self):
+        # the last two rows are invalid (negative variance, zero baseline
+        # mean) and must come back as masked default outputs
+        self.stats_a = [
+            SampleMeanStatistic(sum=1396.87, sum_squares=52377.9767, n=3407),
+            ProportionStatistic(sum=14, n=28),
+            SampleMeanStatistic(sum=1396.87, sum_squares=52377.9767, n=2),
+            ProportionStatistic(sum=0, n=30),
+        ]
+        self.stats_b = [
+            SampleMeanStatistic(sum=2422.7, sum_squares=134698.29, n=3461),
+            ProportionStatistic(sum=16, n=30),
+            SampleMeanStatistic(sum=2422.7, sum_squares=134698.29, n=3461),
+            ProportionStatistic(sum=16, n=30),
+        ]
+
+    def test_batch_matches_per_row(self):
+        batch_results = compute_results_batch(self.stats_a, self.stats_b)
+        for stat_a, stat_b, batch_result in zip(
+            self.stats_a, self.stats_b, batch_results
+        ):
+            per_row = asdict(TwoSidedTTest(stat_a, stat_b).compute_result())
+            per_row["error_message"] = None
+            self.assertDictEqual(
+                _round_result_dict(asdict(batch_result)),
+                _round_result_dict(per_row),
+            )
+
+    def test_batch_matches_per_row_absolute(self):
+        config = FrequentistConfig(difference_type="absolute")
+        batch_results = compute_results_batch(self.stats_a, self.stats_b, config)
+        for stat_a, stat_b, batch_result in zip(
+            self.stats_a, self.stats_b, batch_results
+        ):
+            per_row = asdict(TwoSidedTTest(stat_a, stat_b, config).compute_result())
+            per_row["error_message"] = None
+            self.assertDictEqual(
+                _round_result_dict(asdict(batch_result)),
+                _round_result_dict(per_row),
+            )
+
+    def test_batch_matches_per_row_test_value(self):
+        config = FrequentistConfig(test_value=0.1)
+        batch_results = compute_results_batch(self.stats_a, self.stats_b, config)
+        for stat_a, stat_b, batch_result in zip(
+            self.stats_a, self.stats_b, batch_results
+        ):
+            per_row = asdict(TwoSidedTTest(stat_a, stat_b, config).compute_result())
+            per_row["error_message"] = None
+            self.assertDictEqual(
+                _round_result_dict(asdict(batch_result)),
+                _round_result_dict(per_row),
+            )
+
+    def test_batch_rejects_scaled(self):
+        config = FrequentistConfig(difference_type="scaled")
+        with self.assertRaises(ValueError):
+            compute_results_batch(self.stats_a, self.stats_b, config)
+
+
 class TestSequentialTTest(TestCase):
     def test_sequential_test_runs(self):
         stat_a = SampleMeanStatistic(sum=1396.87, sum_squares=52377.9767, n=3000)
@@ -0,0 +1,33 @@
+from unittest import TestCase, main as unittest_main
+
+import numpy as np
+
+from gbstats.utils import check_srm, check_srm_batch
+
+
+class TestCheckSrmBatch(TestCase):
+    def test_batch_matches_per_experiment(self):
+        users_2d = [
+            [100, 120],
+            [5000, 5100],
+            [0, 0],
+            [10, 300],
+        ]
+        weights = [0.5, 0.5]
+        batch = check_srm_batch(np.array(users_2d), np.array(weights))
+        for users, p in zip(users_2d, batch):
+            self.assertAlmostEqual(p, check_srm(users, weights))
+
+    def test_batch_matches_with_zero_weight(self):
+        users_2d = [
+            [100, 120, 0],
+            [40, 60, 3],
+        ]
+        weights = [0.5, 0.5, 0.0]
+        batch = check_srm_batch(np.array(users_2d), np.array(weights))
+        for users, p in zip(users_2d, batch):
+            self.assertAlmostEqual(p, check_srm(users, weights))
+
+
+if __name__ == "__main__":
+    unittest_main()